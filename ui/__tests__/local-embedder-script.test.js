@@ -0,0 +1,137 @@
+/**
+ * local_embedder.py script tests
+ * Runs the real script against a stub sentence_transformers module so the
+ * batching, slicing and per-request error paths are exercised end to end.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const PYTHON = process.env.SQUIDRUN_PYTHON || 'python';
+const SCRIPT_PATH = path.join(__dirname, '..', 'scripts', 'local_embedder.py');
+
+// Vector for text t is [len(t), 1.0, 0.5]; non-string texts fail like a real model would.
+const STUB_MODEL = `
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SentenceTransformer:
+    def __init__(self, name, **kwargs):
+        self.name = name
+
+    def encode(self, texts, **kwargs):
+        if any(not isinstance(t, str) for t in texts):
+            raise ValueError("bad text")
+        rows = [[float(len(t)), 1.0, 0.5] for t in texts]
+        if np is None:
+            return rows
+        return np.asarray(rows, dtype=np.float32).reshape(len(rows), 3)
+`;
+
+const BLOCK_ORJSON = 'raise ImportError("orjson disabled for test")\n';
+
+function canImport(modules) {
+  try {
+    const result = spawnSync(PYTHON, ['-c', `import ${modules}`], { encoding: 'utf8' });
+    return result.status === 0;
+  } catch {
+    return false;
+  }
+}
+
+const hasPython = canImport('sys');
+const hasOrjson = hasPython && canImport('numpy, orjson');
+
+const maybeDescribe = hasPython ? describe : describe.skip;
+
+maybeDescribe('local_embedder.py', () => {
+  let tempDir;
+  let stubDir;
+  let blockDir;
+
+  beforeAll(() => {
+    tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'local-embedder-script-'));
+    stubDir = path.join(tempDir, 'stub');
+    blockDir = path.join(tempDir, 'block');
+    fs.mkdirSync(stubDir);
+    fs.mkdirSync(blockDir);
+    fs.writeFileSync(path.join(stubDir, 'sentence_transformers.py'), STUB_MODEL);
+    fs.writeFileSync(path.join(blockDir, 'orjson.py'), BLOCK_ORJSON);
+  });
+
+  afterAll(() => {
+    fs.rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  function runScript(lines, { useOrjson }) {
+    const pythonPath = useOrjson ? [stubDir] : [blockDir, stubDir];
+    const result = spawnSync(PYTHON, [SCRIPT_PATH], {
+      input: lines.map((line) => (typeof line === 'string' ? line : JSON.stringify(line))).join('\n') + '\n',
+      encoding: 'utf8',
+      env: { ...process.env, PYTHONPATH: pythonPath.join(path.delimiter) },
+    });
+    expect(result.stderr).toBe('');
+    expect(result.status).toBe(0);
+    return result.stdout.trim().split('\n').map((line) => JSON.parse(line));
+  }
+
+  const modes = [
+    ['orjson', true, hasOrjson],
+    ['stdlib json', false, true],
+  ];
+
+  describe.each(modes)('%s serializer', (_label, useOrjson, available) => {
+    const maybeTest = available ? test : test.skip;
+
+    maybeTest('slices batched vectors back per request, including empty texts', () => {
+      const responses = runScript([
+        { id: 'a', texts: ['x'] },
+        { id: 'b', texts: [] },
+        { id: 'c', texts: ['yy', 'zzz'] },
+      ], { useOrjson });
+
+      expect(responses).toEqual([
+        { id: 'a', vectors: [[1, 1, 0.5]], dim: 3 },
+        { id: 'b', vectors: [], dim: 0 },
+        { id: 'c', vectors: [[2, 1, 0.5], [3, 1, 0.5]], dim: 3 },
+      ]);
+    });
+
+    maybeTest('fails only the request with a bad text', () => {
+      const responses = runScript([
+        { id: 'a', texts: ['ok'] },
+        { id: 'b', texts: ['ok', null] },
+        { id: 'c', texts: ['fine'] },
+      ], { useOrjson });
+
+      expect(responses).toEqual([
+        { id: 'a', vectors: [[2, 1, 0.5]], dim: 3 },
+        { id: 'b', error: 'bad text' },
+        { id: 'c', vectors: [[4, 1, 0.5]], dim: 3 },
+      ]);
+    });
+
+    maybeTest('rejects non-object requests and non-list texts', () => {
+      const responses = runScript([
+        '[1]',
+        '"x"',
+        'not json',
+        { id: 's', texts: 'abc' },
+        { id: 'ok', texts: ['q'] },
+      ], { useOrjson });
+
+      expect(responses).toHaveLength(5);
+      expect(responses[0]).toEqual({ id: null, error: 'request must be a JSON object' });
+      expect(responses[1]).toEqual({ id: null, error: 'request must be a JSON object' });
+      expect(responses[2].id).toBeNull();
+      expect(typeof responses[2].error).toBe('string');
+      expect(responses[3]).toEqual({ id: 's', error: 'texts must be a list' });
+      expect(responses[4]).toEqual({ id: 'ok', vectors: [[1, 1, 0.5]], dim: 3 });
+    });
+  });
+});
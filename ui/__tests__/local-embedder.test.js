@@ -110,6 +110,60 @@ describe('Local Embedder', () => {
       mockProcess.stdout.emit('data', response);
       await embedPromise;
     });
+
+    test('passes inference backend to the embedder script', async () => {
+      const embedder = createLocalEmbedder({ backend: 'onnx' });
+
+      const embedPromise = embedder.embed('test');
+
+      expect(spawn).toHaveBeenCalledWith(
+        expect.any(String),
+        expect.arrayContaining(['--backend', 'onnx']),
+        expect.any(Object)
+      );
+
+      // Cleanup
+      const response = JSON.stringify({ id: '1', vectors: [[0.1, 0.2]] }) + '\n';
+      mockProcess.stdout.emit('data', response);
+      await embedPromise;
+    });
+
+    test('omits backend flag by default', async () => {
+      const savedBackend = process.env.SQUIDRUN_EMBEDDER_BACKEND;
+      delete process.env.SQUIDRUN_EMBEDDER_BACKEND;
+      try {
+        const embedder = createLocalEmbedder();
+
+        const embedPromise = embedder.embed('test');
+
+        expect(spawn.mock.calls[0][1]).not.toContain('--backend');
+
+        // Cleanup
+        const response = JSON.stringify({ id: '1', vectors: [[0.1, 0.2]] }) + '\n';
+        mockProcess.stdout.emit('data', response);
+        await embedPromise;
+      } finally {
+        if (savedBackend === undefined) {
+          delete process.env.SQUIDRUN_EMBEDDER_BACKEND;
+        } else {
+          process.env.SQUIDRUN_EMBEDDER_BACKEND = savedBackend;
+        }
+      }
+    });
+
+    test('ignores unknown backend and warns', async () => {
+      const embedder = createLocalEmbedder({ backend: 'tensorrt' });
+
+      const embedPromise = embedder.embed('test');
+
+      expect(spawn.mock.calls[0][1]).not.toContain('--backend');
+      expect(log.warn).toHaveBeenCalledWith('Embeddings', expect.stringContaining('tensorrt'));
+
+      // Cleanup
+      const response = JSON.stringify({ id: '1', vectors: [[0.1, 0.2]] }) + '\n';
+      mockProcess.stdout.emit('data', response);
+      await embedPromise;
+    });
   });
 
   describe('embed', () => {
@@ -444,5 +498,37 @@ describe('Local Embedder', () => {
       mockProcess.stdout.emit('data', JSON.stringify({ id: '1', vectors: [[0.1]] }) + '\n');
       await embedPromise;
     });
+
+    test('uses SQUIDRUN_EMBEDDER_BACKEND env var', async () => {
+      process.env.SQUIDRUN_EMBEDDER_BACKEND = 'openvino';
+
+      const embedder = createLocalEmbedder();
+      const embedPromise = embedder.embed('test');
+
+      expect(spawn).toHaveBeenCalledWith(
+        expect.any(String),
+        expect.arrayContaining(['--backend', 'openvino']),
+        expect.any(Object)
+      );
+
+      // Cleanup
+      mockProcess.stdout.emit('data', JSON.stringify({ id: '1', vectors: [[0.1]] }) + '\n');
+      await embedPromise;
+    });
+
+    test('backend option takes precedence over SQUIDRUN_EMBEDDER_BACKEND', async () => {
+      process.env.SQUIDRUN_EMBEDDER_BACKEND = 'openvino';
+
+      const embedder = createLocalEmbedder({ backend: 'onnx' });
+      const embedPromise = embedder.embed('test');
+
+      const args = spawn.mock.calls[0][1];
+      expect(args).toEqual(expect.arrayContaining(['--backend', 'onnx']));
+      expect(args).not.toContain('openvino');
+
+      // Cleanup
+      mockProcess.stdout.emit('data', JSON.stringify({ id: '1', vectors: [[0.1]] }) + '\n');
+      await embedPromise;
+    });
   });
 });
@@ -9,11 +9,20 @@ const log = require('./logger');
 
 const DEFAULT_MODEL = 'all-MiniLM-L6-v2';
 const DEFAULT_DIM = 384;
+const BACKENDS = new Set(['torch', 'onnx', 'openvino']);
+
+function resolveBackend(requested) {
+  if (!requested) return null;
+  if (BACKENDS.has(requested)) return requested;
+  log.warn('Embeddings', `Ignoring unknown embedder backend "${requested}" (expected torch, onnx or openvino)`);
+  return null;
+}
 
 function createLocalEmbedder(options = {}) {
   const model = options.model || DEFAULT_MODEL;
   const pythonCmd = options.python || process.env.SQUIDRUN_PYTHON || 'python';
   const scriptPath = options.scriptPath || path.join(__dirname, '..', 'scripts', 'local_embedder.py');
+  const backend = resolveBackend(options.backend || process.env.SQUIDRUN_EMBEDDER_BACKEND);
   let dim = options.dim || DEFAULT_DIM;
 
   let proc = null;
@@ -24,8 +33,10 @@ function createLocalEmbedder(options = {}) {
 
   function start() {
     if (proc || failed) return;
+    const args = [scriptPath, '--model', model];
+    if (backend) args.push('--backend', backend);
     try {
-      proc = spawn(pythonCmd, [scriptPath, '--model', model], { stdio: ['pipe', 'pipe', 'pipe'] });
+      proc = spawn(pythonCmd, args, { stdio: ['pipe', 'pipe', 'pipe'] });
     } catch (err) {
       failed = true;
       log.error('Embeddings', 'Failed to spawn python embedder', err);
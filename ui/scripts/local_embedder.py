@@ -3,10 +3,95 @@ import argparse
 import json
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def _to_list(obj):
+        # OPT_SERIALIZE_NUMPY rejects non-contiguous arrays and some dtypes
+        # (e.g. float16 on older orjson) and hands them to default instead.
+        if hasattr(obj, "tolist"):
+            return obj.tolist()
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    def dumps(obj):
+        return orjson.dumps(obj, default=_to_list, option=orjson.OPT_SERIALIZE_NUMPY)
+else:
+    loads = json.loads
+
+    def dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+
+def encode(model, texts, batch_size):
+    vectors = model.encode(texts, batch_size=batch_size, convert_to_numpy=True) if texts else []
+    if orjson is None and hasattr(vectors, "tolist"):
+        vectors = vectors.tolist()
+    return vectors
+
+
+def embed_batch(model, lines, batch_size):
+    """Encode every request in `lines` with a single model.encode call."""
+    responses = []
+    jobs = []
+    texts = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        rid = None
+        try:
+            req = loads(line)
+            if not isinstance(req, dict):
+                raise TypeError("request must be a JSON object")
+            rid = req.get("id")
+            req_texts = req.get("texts", [])
+            if not isinstance(req_texts, list):
+                raise TypeError("texts must be a list")
+            resp = {"id": rid}
+            jobs.append((resp, len(texts), len(texts) + len(req_texts)))
+            texts.extend(req_texts)
+        except Exception as exc:
+            resp = {
+                "id": rid,
+                "error": str(exc),
+            }
+        responses.append(resp)
+
+    if not jobs:
+        return responses
+
+    try:
+        vectors = encode(model, texts, batch_size)
+    except Exception:
+        # Retry one request at a time so a bad request only fails itself.
+        for resp, start, end in jobs:
+            try:
+                vectors = encode(model, texts[start:end], batch_size)
+            except Exception as exc:
+                resp["error"] = str(exc)
+                continue
+            resp["vectors"] = vectors
+            resp["dim"] = len(vectors[0]) if len(vectors) else 0
+        return responses
+
+    dim = len(vectors[0]) if len(vectors) else 0
+    for resp, start, end in jobs:
+        resp["vectors"] = vectors[start:end]
+        resp["dim"] = dim if end > start else 0
+    return responses
+
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--backend", choices=("torch", "onnx", "openvino"), default="torch")
     args = parser.parse_args()
 
     try:
@@ -16,29 +101,38 @@ def main():
         sys.stderr.flush()
         return 1
 
-    model = SentenceTransformer(args.model)
+    # Only pass backend when asked: sentence-transformers < 3.2 rejects the kwarg.
+    if args.backend != "torch":
+        model = SentenceTransformer(args.model, backend=args.backend)
+    else:
+        model = SentenceTransformer(args.model)
 
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            req = json.loads(line)
-            texts = req.get("texts", [])
-            vectors = model.encode(texts).tolist() if texts else []
-            dim = len(vectors[0]) if vectors else 0
-            resp = {
-                "id": req.get("id"),
-                "vectors": vectors,
-                "dim": dim,
-            }
-        except Exception as exc:
-            resp = {
-                "id": req.get("id"),
-                "error": str(exc),
-            }
-        sys.stdout.write(json.dumps(resp) + "\n")
-        sys.stdout.flush()
+    reader = sys.stdin.buffer
+    out = sys.stdout.buffer
+    buf = bytearray()
+
+    # read1 returns whatever is already buffered in the pipe, so requests that
+    # arrive back-to-back are coalesced into one encode call.
+    while True:
+        chunk = reader.read1(65536)
+        if chunk:
+            buf += chunk
+            if b"\n" not in chunk:
+                continue
+            end = buf.rindex(b"\n")
+            lines = buf[:end].split(b"\n")
+            del buf[:end + 1]
+        else:
+            lines = [buf]
+        for resp in embed_batch(model, lines, args.batch_size):
+            try:
+                payload = dumps(resp)
+            except Exception as exc:
+                payload = dumps({"id": resp.get("id"), "error": str(exc)})
+            out.write(payload + b"\n")
+        out.flush()
+        if not chunk:
+            break
 
     return 0
 